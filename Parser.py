@@ -1,41 +1,180 @@
 """Utilities for parsing emails and removing signature blocks.
 
-This module exposes a single public function, :func:`convert`, that takes the
-path of a plaintext email, scores each line using a lightweight spaCy powered
-heuristic, and writes a new file with the signature block removed.
+This module exposes :func:`convert`, which takes the path of a plaintext email,
+scores each line using a lightweight verb-detection heuristic (optionally
+backed by spaCy part-of-speech tags), and writes a new file with the signature
+block removed. :func:`convert_many` does the same for a batch of emails while
+sharing one loaded model, and :func:`compare_scorers` checks the heuristic
+against spaCy on a given email.
 """
 
 from __future__ import annotations
 
-from functools import lru_cache
+from functools import lru_cache, partial
 from html import unescape
 from pathlib import Path
-from typing import Iterable, Tuple
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import re
 import string
-import numpy as np
 import spacy
-from mailparser import parse_from_file
+from mailparser import parse_from_bytes
 
 
 DEFAULT_MODEL = "en_core_web_sm"
-SIGNATURE_CLOSINGS = {
-    "best",
-    "best regards",
-    "best wishes",
-    "thanks",
-    "thank you",
-    "thanks a lot",
-    "regards",
-    "kind regards",
-    "warm regards",
-    "cheers",
-    "sincerely",
-    "yours truly",
-    "yours sincerely",
-    "many thanks",
-}
+# Pipeline components that do not contribute to ``token.pos_``. In the v3
+# English pipelines the tagger predicts fine-grained ``tag_`` values and the
+# attribute ruler maps them onto coarse ``pos_``, so both of those must stay.
+TAGGER_EXCLUDED_COMPONENTS = ("parser", "ner", "lemmatizer", "senter")
+MAX_CANDIDATE_LENGTH = 60
+MAX_CANDIDATE_WORDS = 4
+PIPE_BATCH_SIZE = 64
+WRITE_CHUNK_SIZE = 1024
+# Bit flags returned by _classify.
+LINE_HEADER = 1 << 0
+LINE_QUOTE_DELIMITER = 1 << 1
+LINE_QUOTE_HEADER = 1 << 2
+LINE_TERMINATOR = 1 << 3
+LINE_SIGNATURE_START = 1 << 4
+COMMON_VERBS = frozenset(
+    {
+        "am",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "can",
+        "could",
+        "will",
+        "would",
+        "should",
+        "may",
+        "might",
+        "must",
+        "get",
+        "got",
+        "go",
+        "make",
+        "made",
+        "take",
+        "see",
+        "know",
+        "think",
+        "say",
+        "said",
+        "tell",
+        "give",
+        "find",
+        "let",
+        "put",
+        "keep",
+        "send",
+        "sent",
+        "need",
+        "want",
+        "look",
+        "call",
+        "try",
+        "ask",
+        "work",
+        "hope",
+        "help",
+        "check",
+        "attach",
+        "please",
+        "read",
+        "write",
+        "reply",
+        "review",
+        "share",
+        "confirm",
+        "update",
+        "join",
+        "talk",
+        "meet",
+        "run",
+        "hear",
+        "show",
+    }
+)
+VERB_SUFFIXES = ("ed", "ing")
+# -ed/-ing words that are nouns or adjectives in the department, company and
+# title lines signatures are made of.
+NON_VERB_WORDS = frozenset(
+    {
+        "accounting",
+        "advertising",
+        "banking",
+        "billing",
+        "branding",
+        "building",
+        "catering",
+        "clothing",
+        "computing",
+        "consulting",
+        "engineering",
+        "evening",
+        "financing",
+        "funding",
+        "gaming",
+        "hosting",
+        "housing",
+        "incorporated",
+        "indeed",
+        "learning",
+        "licensing",
+        "limited",
+        "lighting",
+        "marketing",
+        "meeting",
+        "mining",
+        "morning",
+        "networking",
+        "nursing",
+        "packaging",
+        "planning",
+        "printing",
+        "programming",
+        "publishing",
+        "purchasing",
+        "recruiting",
+        "shipping",
+        "sourcing",
+        "speed",
+        "staffing",
+        "testing",
+        "trading",
+        "training",
+        "united",
+        "wedding",
+    }
+)
+SIGNATURE_CLOSINGS = frozenset(
+    {
+        "best",
+        "best regards",
+        "best wishes",
+        "thanks",
+        "thank you",
+        "thanks a lot",
+        "regards",
+        "kind regards",
+        "warm regards",
+        "cheers",
+        "sincerely",
+        "yours truly",
+        "yours sincerely",
+        "many thanks",
+    }
+)
 SIGNATURE_START_PREFIXES = (
     "sent from my",
     "sent from mail for",
@@ -44,24 +183,52 @@ SIGNATURE_START_PREFIXES = (
     "get outlook for",
     "sent with my",
 )
-CONTACT_KEYWORDS = {
-    "tel",
-    "phone",
-    "mobile",
-    "cell",
-    "fax",
-    "email",
-    "www",
-    "http",
-    "linkedin",
-}
+# Closings are short, so longer lines can skip normalisation entirely. The
+# limit leaves room for surrounding punctuation such as "-- Best regards,".
+SIGNATURE_CLOSING_MAX_LENGTH = 32
+# Punctuation and spaces around a closing are ignored. The prefix pattern
+# skips them itself so it can be matched against the raw line.
+SIGNATURE_STRIP_CHARS = string.punctuation + " "
+SIGNATURE_START_RE = re.compile(
+    rf"[{re.escape(SIGNATURE_STRIP_CHARS)}]*(?:"
+    + "|".join(re.escape(prefix) for prefix in SIGNATURE_START_PREFIXES)
+    + ")",
+    re.IGNORECASE,
+)
+CONTACT_KEYWORDS = frozenset(
+    {
+        "tel",
+        "phone",
+        "mobile",
+        "cell",
+        "fax",
+        "email",
+        "www",
+        "http",
+        "linkedin",
+    }
+)
 CONTACT_EMAIL_RE = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
 CONTACT_PHONE_RE = re.compile(r"(?:\+?\d[\d\s().-]{6,}\d)")
+WORD_RE = re.compile(r"\S+")
+CONTACT_KEYWORD_MAX_LENGTH = 80
+CONTACT_PIPE_MAX_LENGTH = 120
+# Alternatives are tried left to right, so the line-breaking tags win over the
+# catch-all tag pattern. Group numbers index into ``HTML_REPLACEMENTS``.
+HTML_MARKUP_RE = re.compile(r"(<br\s*/?>)|(</p>)|(</div>)|<[^>]+>", re.IGNORECASE)
+HTML_REPLACEMENTS = ("", "\n", "\n\n", "\n")
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+# A body wrapped in a single pair of double quotes; a lone quote counts as an
+# empty quoted body.
+OUTER_QUOTE_RE = re.compile(r'\s*"(?:(.*)")?\s*', re.DOTALL)
+QUOTE_DELIMITER_CHARS = "-_·=*#"
 QUOTE_DELIMITER_KEYWORDS = (
     "original message",
     "forwarded message",
     "forwarded by",
 )
+QUOTE_DELIMITER_RE = re.compile("|".join(re.escape(keyword) for keyword in QUOTE_DELIMITER_KEYWORDS))
 EMAIL_HEADER_PREFIXES = (
     "from ",
     "from:",
@@ -74,6 +241,12 @@ EMAIL_HEADER_PREFIXES = (
     "mime-version",
     "content-type",
 )
+# An mbox "From " line, a field name followed by a colon, or a folded
+# continuation line: the first-line test of the stdlib email parser.
+MIME_HEADER_RE = re.compile(rb"From |[!-9;-~]*:|[\t ]")
+EMAIL_HEADER_RE = re.compile(
+    "|".join(re.escape(prefix) for prefix in EMAIL_HEADER_PREFIXES), re.IGNORECASE
+)
 
 
 def convert(
@@ -81,6 +254,8 @@ def convert(
     threshold: float = 0.9,
     model: str = DEFAULT_MODEL,
     /,
+    *,
+    use_spacy: bool = False,
 ) -> str:
     """Parse *fname* and write a ``*_clean`` copy without the signature block.
 
@@ -89,9 +264,14 @@ def convert(
     fname:
         Path to the plaintext email that should be cleaned.
     threshold:
-        Upper bound on ``prob(signature | line)`` for a line to be kept.
+        Upper bound on ``prob(signature | line)`` for a short line inside a
+        signature block to be kept.
     model:
         Name of the spaCy language model used for part-of-speech tagging.
+    use_spacy:
+        Score candidate lines with spaCy part-of-speech tags instead of the
+        built-in verb heuristic. Mainly useful for parity checks. The model
+        is only loaded once a signature block contains a short line to score.
 
     Returns
     -------
@@ -100,17 +280,89 @@ def convert(
         working directory.
     """
 
+    input_path = _resolve_input_path(fname)
+    get_tagger = partial(_get_tagger, model) if use_spacy else None
+    return _convert_path(input_path, get_tagger, threshold)
+
+
+def convert_many(
+    fnames: Iterable[str | Path],
+    threshold: float = 0.9,
+    model: str = DEFAULT_MODEL,
+    /,
+    *,
+    use_spacy: bool = False,
+) -> List[str]:
+    """Clean every email in *fnames*, loading the spaCy model at most once.
+
+    Prefer this over calling :func:`convert` from a shell loop: a new Python
+    process has to reload the spaCy model every time, whereas here it is
+    loaded on first use and shared by all inputs.
+
+    Parameters
+    ----------
+    fnames:
+        Paths to the plaintext emails that should be cleaned. All of them are
+        checked for existence before any output is written.
+    threshold, model, use_spacy:
+        As for :func:`convert`.
+
+    Returns
+    -------
+    list of str
+        The paths of the generated ``*_clean`` files, in input order.
+    """
+
+    input_paths = [_resolve_input_path(fname) for fname in fnames]
+    get_tagger = partial(_get_tagger, model) if use_spacy else None
+    return [_convert_path(input_path, get_tagger, threshold) for input_path in input_paths]
+
+
+def compare_scorers(
+    fname: str | Path,
+    model: str = DEFAULT_MODEL,
+    /,
+) -> List[Tuple[str, Tuple[float, int], Tuple[float, int]]]:
+    """Score the short lines of *fname* with both the heuristic and spaCy.
+
+    A parity check for the verb heuristic: every line short enough to be
+    scored, and not contact info, is returned with its heuristic
+    ``(score, token_count)`` followed by the spaCy one. No output is written.
+    """
+
+    input_path = _resolve_input_path(fname)
+    texts = []
+    for sentence in _corpus_to_sentences(_extract_email_body(input_path)):
+        stripped = sentence.strip()
+        if (
+            stripped
+            and _should_consider_probability(stripped)
+            and not _looks_like_contact_info(stripped)
+        ):
+            texts.append(stripped)
+
+    docs = _get_tagger(model).pipe(texts, batch_size=PIPE_BATCH_SIZE)
+    return [(text, _prob_block(text), _score_doc(doc)) for text, doc in zip(texts, docs)]
+
+
+def _resolve_input_path(fname: str | Path) -> Path:
     input_path = Path(fname).expanduser()
     if not input_path.is_file():
         raise FileNotFoundError(f"Email file not found: {input_path}")
+    return input_path
 
+
+def _convert_path(
+    input_path: Path,
+    get_tagger: Optional[Callable[[], Any]],
+    threshold: float,
+) -> str:
     output_path = _derive_output_path(input_path)
 
     original_email = _extract_email_body(input_path)
     sentences = _corpus_to_sentences(original_email)
 
-    tagger = _get_tagger(model)
-    _write_clean_email(sentences, output_path, tagger, threshold)
+    _write_clean_email(sentences, output_path, get_tagger, threshold)
 
     return str(output_path)
 
@@ -122,30 +374,45 @@ def _derive_output_path(input_path: Path) -> Path:
     return input_path.with_name(clean_name)
 
 
-def _corpus_to_sentences(corpus: str) -> Iterable[str]:
-    return corpus.splitlines(keepends=True)
+def _corpus_to_sentences(corpus: str) -> Iterator[str]:
+    """Yield the lines of *corpus* one at a time, keeping their line endings."""
 
+    start = 0
+    end = len(corpus)
+    while start < end:
+        newline = corpus.find("\n", start)
+        if newline == -1:
+            yield corpus[start:]
+            return
+        yield corpus[start : newline + 1]
+        start = newline + 1
 
-def _extract_email_body(input_path: Path) -> str:
-    raw_text = input_path.read_text(encoding="utf-8")
 
-    body = _parse_body_with_mailparser(input_path)
+def _extract_email_body(input_path: Path) -> str:
+    raw = input_path.read_bytes()
+    # Match read_text(): strict UTF-8 with universal newlines.
+    raw_text = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+    # MIME_HEADER_RE mirrors the first-line test of the stdlib email parser
+    # that mailparser builds on, including indented continuation lines. Any
+    # other first line makes the parser treat the whole file as the body, so
+    # it is used as-is.
+    body = _parse_body_with_mailparser(raw) if MIME_HEADER_RE.match(raw) else ""
     if not body.strip():
         body = raw_text
 
-    if re.search(r"<[^>]+>", body):
+    if "<" in body and HTML_TAG_RE.search(body):
         body = _html_to_text(body)
 
-    body = body.strip()
-    if body.startswith('"') and body.endswith('"'):
-        body = body[1:-1].strip()
+    quoted = OUTER_QUOTE_RE.fullmatch(body)
+    body = (quoted.group(1) or "").strip() if quoted else body.strip()
 
     return body.replace("\r\n", "\n")
 
 
-def _parse_body_with_mailparser(input_path: Path) -> str:
+def _parse_body_with_mailparser(raw: bytes) -> str:
     try:
-        mail = parse_from_file(str(input_path))
+        mail = parse_from_bytes(raw)
     except Exception:
         return ""
 
@@ -172,26 +439,48 @@ def _parse_body_with_mailparser(input_path: Path) -> str:
 def _write_clean_email(
     sentences: Iterable[str],
     output_path: Path,
-    tagger,
+    get_tagger: Optional[Callable[[], Any]],
     threshold: float,
 ) -> None:
+    """Write *sentences* to *output_path*, skipping the signature block.
+
+    Short lines inside a signature block are held back and scored in batches
+    by :func:`_score_signature_lines`; those scoring below *threshold* read
+    as prose and are kept. Scoring never reorders the output because every
+    other signature line is dropped.
+    """
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     signature_mode = False
     recent_delimiter = False
+    kept_lines: List[str] = []
+    # Short signature-block lines, as (line, stripped line), awaiting a score.
+    pending: List[Tuple[str, str]] = []
 
     with output_path.open("w", encoding="utf-8") as new_file:
         for sentence in sentences:
+            if len(kept_lines) >= WRITE_CHUNK_SIZE:
+                new_file.writelines(kept_lines)
+                kept_lines.clear()
+
             stripped = sentence.strip()
+            flags = _classify(stripped) if stripped else 0
 
             if signature_mode:
-                if _is_signature_terminator(stripped):
+                if flags & (LINE_TERMINATOR | LINE_HEADER):
+                    kept_lines.extend(
+                        _score_signature_lines(pending, get_tagger, threshold)
+                    )
+                    pending.clear()
+
+                if flags & LINE_TERMINATOR:
                     signature_mode = False
-                    recent_delimiter = _is_quote_delimiter(stripped)
-                    new_file.write(sentence)
+                    recent_delimiter = bool(flags & LINE_QUOTE_DELIMITER)
+                    kept_lines.append(sentence)
                     continue
 
-                if _is_email_header_line(stripped):
+                if flags & LINE_HEADER:
                     signature_mode = False
                     recent_delimiter = False
                 else:
@@ -202,30 +491,33 @@ def _write_clean_email(
                         continue
 
                     if _should_consider_probability(stripped):
-                        score, token_count = _prob_block(stripped, tagger)
-                        if token_count and score >= threshold:
-                            continue
+                        pending.append((sentence, stripped))
+                        if len(pending) >= PIPE_BATCH_SIZE:
+                            kept_lines.extend(
+                                _score_signature_lines(pending, get_tagger, threshold)
+                            )
+                            pending.clear()
 
                     continue
 
             if not stripped:
-                new_file.write(sentence)
+                kept_lines.append(sentence)
                 # Preserve delimiter context for blank lines
                 continue
 
-            if _is_signature_start(stripped):
+            if flags & LINE_SIGNATURE_START:
                 signature_mode = True
                 recent_delimiter = False
                 continue
 
-            if _is_quote_delimiter(stripped):
+            if flags & LINE_QUOTE_DELIMITER:
                 recent_delimiter = True
-                new_file.write(sentence)
+                kept_lines.append(sentence)
                 continue
 
-            if _is_quote_header(stripped):
+            if flags & LINE_QUOTE_HEADER:
                 recent_delimiter = False
-                new_file.write(sentence)
+                kept_lines.append(sentence)
                 continue
 
             if recent_delimiter and _looks_like_contact_info(stripped):
@@ -233,93 +525,188 @@ def _write_clean_email(
                 recent_delimiter = False
                 continue
 
-            if _is_email_header_line(stripped):
-                new_file.write(sentence)
+            if flags & LINE_HEADER:
+                kept_lines.append(sentence)
                 continue
 
             recent_delimiter = False
-            new_file.write(sentence)
+            kept_lines.append(sentence)
 
+        kept_lines.extend(_score_signature_lines(pending, get_tagger, threshold))
+        new_file.writelines(kept_lines)
 
-def _prob_block(sentence: str, tagger) -> Tuple[float, int]:
-    doc = tagger(sentence)
+
+def _score_signature_lines(
+    lines: Sequence[Tuple[str, str]],
+    get_tagger: Optional[Callable[[], Any]],
+    threshold: float,
+) -> List[str]:
+    """Return the signature-block *lines* that read as prose and should be kept.
+
+    *lines* holds ``(line, stripped line)`` pairs, scored in one batch. A line
+    is dropped when its non-verb fraction is at least *threshold*.
+    *get_tagger* is an optional zero-argument callable returning a spaCy
+    pipeline; it is only invoked when *lines* is not empty. ``None`` selects
+    the verb heuristic in :func:`_prob_block`.
+    """
+
+    if not lines:
+        return []
+
+    texts = [stripped for _, stripped in lines]
+    if get_tagger is None:
+        scores = [_prob_block(text) for text in texts]
+    else:
+        docs = get_tagger().pipe(texts, batch_size=PIPE_BATCH_SIZE)
+        scores = [_score_doc(doc) for doc in docs]
+
+    return [
+        sentence
+        for (sentence, _), (score, token_count) in zip(lines, scores)
+        if not (token_count and score >= threshold)
+    ]
+
+
+def _prob_block(sentence: str) -> Tuple[float, int]:
+    """Return the fraction of non-verb tokens in *sentence* and the token count.
+
+    Verbs are detected with :func:`_looks_verby`; :func:`_score_doc` is the
+    spaCy counterpart.
+    """
+
+    tokens = sentence.split()
+    if not tokens:
+        return 0.0, 0
+
+    verb_absence = sum(not _looks_verby(token.lower()) for token in tokens)
+    return verb_absence / len(tokens), len(tokens)
+
+
+def _score_doc(doc) -> Tuple[float, int]:
     if not doc:
         return 0.0, 0
 
-    verb_absence = np.sum(token.pos_ != "VERB" for token in doc)
-    return float(verb_absence) / len(doc), len(doc)
+    verb_absence = sum(1 for token in doc if token.pos_ != "VERB")
+    return verb_absence / len(doc), len(doc)
+
+
+def _looks_verby(word: str) -> bool:
+    word = word.strip(string.punctuation)
+    if word in COMMON_VERBS:
+        return True
+    if len(word) > 4 and word.endswith(VERB_SUFFIXES) and word not in NON_VERB_WORDS:
+        return True
+    return word.endswith("s") and word[:-1] in COMMON_VERBS
 
 
 @lru_cache(maxsize=None)
 def _get_tagger(model_name: str):
-    return spacy.load(model_name)
+    """Load *model_name* with only the components needed for ``token.pos_``.
+
+    Only short candidate lines (see :func:`_should_consider_probability`) are
+    ever tagged, so ``max_length`` is capped accordingly.
+    """
+
+    nlp = spacy.load(model_name, exclude=list(TAGGER_EXCLUDED_COMPONENTS))
+    nlp.max_length = MAX_CANDIDATE_LENGTH
+    return nlp
+
+
+def _classify(sentence: str) -> int:
+    """Return the ``LINE_*`` flags that apply to the stripped *sentence*.
+
+    Only the cheap checks the writer needs on every line are folded in here;
+    contact info and scoring candidates are checked on the branches that use
+    them.
+    """
+
+    lower = sentence.lower()
+    flags = 0
+    if _is_email_header_line(sentence):
+        flags |= LINE_HEADER
+    if _is_quote_delimiter(sentence, lower):
+        flags |= LINE_QUOTE_DELIMITER | LINE_TERMINATOR
+    if _is_quote_header(lower):
+        flags |= LINE_QUOTE_HEADER | LINE_TERMINATOR
+    if _is_signature_start(sentence, lower):
+        flags |= LINE_SIGNATURE_START
+    return flags
 
 
 def _should_consider_probability(sentence: str) -> bool:
     length = len(sentence)
     word_count = len(sentence.split())
-    return length <= 60 and word_count <= 4
+    return length <= MAX_CANDIDATE_LENGTH and word_count <= MAX_CANDIDATE_WORDS
 
 
-def _is_signature_start(sentence: str) -> bool:
-    normalized = _normalize_sentence(sentence)
-    if normalized in SIGNATURE_CLOSINGS:
+def _is_signature_start(stripped: str, lower_stripped: str) -> bool:
+    if SIGNATURE_START_RE.match(stripped) is not None:
         return True
-    return any(normalized.startswith(prefix) for prefix in SIGNATURE_START_PREFIXES)
+    if len(stripped) > SIGNATURE_CLOSING_MAX_LENGTH:
+        return False
+    return lower_stripped.strip(SIGNATURE_STRIP_CHARS) in SIGNATURE_CLOSINGS
 
 
 def _looks_like_contact_info(sentence: str) -> bool:
-    if CONTACT_EMAIL_RE.search(sentence):
+    # Cheapest checks first: substring scans, then the regexes.
+    length = len(sentence)
+    if "|" in sentence and length <= CONTACT_PIPE_MAX_LENGTH:
+        return True
+
+    if length <= CONTACT_KEYWORD_MAX_LENGTH:
+        normalized = sentence.lower()
+        if any(keyword in normalized for keyword in CONTACT_KEYWORDS):
+            return True
+
+    if "@" in sentence and CONTACT_EMAIL_RE.search(sentence):
         return True
     if CONTACT_PHONE_RE.search(sentence):
         return True
 
-    normalized = sentence.lower()
-    if any(keyword in normalized for keyword in CONTACT_KEYWORDS) and len(sentence) <= 80:
-        return True
+    return _short_capitalized_heuristic(sentence)
 
-    if "|" in sentence and len(sentence) <= 120:
-        return True
 
-    capitalized_words = sum(word[:1].isupper() for word in sentence.split())
-    if len(sentence.split()) <= 4 and capitalized_words >= 2:
-        return True
+def _short_capitalized_heuristic(sentence: str) -> bool:
+    """Return ``True`` for lines of at most four words with two or more capitalised.
 
-    return False
+    Words are scanned in place and the scan stops at the fifth word, so no word
+    list is built for long lines.
+    """
 
+    word_count = 0
+    capitalized_words = 0
+    for match in WORD_RE.finditer(sentence):
+        word_count += 1
+        if word_count > 4:
+            return False
+        if sentence[match.start()].isupper():
+            capitalized_words += 1
 
-def _is_signature_terminator(sentence: str) -> bool:
-    return _is_quote_delimiter(sentence) or _is_quote_header(sentence)
+    return capitalized_words >= 2
 
 
-def _is_quote_header(sentence: str) -> bool:
-    lower = sentence.lower()
-    return lower.startswith("on ") and " wrote:" in lower
+def _is_quote_header(lower_stripped: str) -> bool:
+    return lower_stripped.startswith("on ") and " wrote:" in lower_stripped
 
 
-def _is_quote_delimiter(sentence: str) -> bool:
-    stripped = sentence.strip()
+def _is_quote_delimiter(stripped: str, lower_stripped: str) -> bool:
     if not stripped:
         return False
-    lower = stripped.lower()
     if stripped in {"---", "--"}:
         return True
     if stripped.startswith(">"):
         return True
-    if any(keyword in lower for keyword in QUOTE_DELIMITER_KEYWORDS):
-        return True
-    if len(stripped) >= 3 and len(set(stripped)) == 1 and stripped[0] in {"-", "_", "·", "=", "*", "#"}:
+    if (
+        len(stripped) >= 3
+        and stripped[0] in QUOTE_DELIMITER_CHARS
+        and not stripped.lstrip(stripped[0])
+    ):
         return True
-    return False
+    return QUOTE_DELIMITER_RE.search(lower_stripped) is not None
 
 
 def _is_email_header_line(sentence: str) -> bool:
-    lower = sentence.lower()
-    return lower.startswith(EMAIL_HEADER_PREFIXES)
-
-
-def _normalize_sentence(sentence: str) -> str:
-    return sentence.strip(string.punctuation + " ").lower()
+    return EMAIL_HEADER_RE.match(sentence) is not None
 
 
 def _html_to_text(html: str) -> str:
@@ -328,11 +715,12 @@ def _html_to_text(html: str) -> str:
 
     text = html
     text = text.replace("\r\n", "\n")
-    text = re.sub(r"(?i)<br\s*/?>", "\n", text)
-    text = re.sub(r"(?i)</p>", "\n\n", text)
-    text = re.sub(r"(?i)</div>", "\n", text)
-    text = re.sub(r"<[^>]+>", "", text)
+    text = HTML_MARKUP_RE.sub(_replace_html_markup, text)
     text = unescape(text)
     text = text.replace("\r", "\n")
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = MULTI_NEWLINE_RE.sub("\n\n", text)
     return text.strip()
+
+
+def _replace_html_markup(match: re.Match) -> str:
+    return HTML_REPLACEMENTS[match.lastindex or 0]
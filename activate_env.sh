@@ -12,7 +12,6 @@ echo "Pip location: $(which pip)"
 
 # Test imports
 echo "Testing imports..."
-python -c "import numpy; print('✓ numpy:', numpy.__version__)" 2>/dev/null || echo "✗ numpy import failed"
 python -c "import spacy; print('✓ spacy:', spacy.__version__)" 2>/dev/null || echo "✗ spacy import failed"
 python -c "import spacy; spacy.load('en_core_web_sm'); print('✓ en_core_web_sm model loaded')" 2>/dev/null || echo "✗ en_core_web_sm model failed"
 